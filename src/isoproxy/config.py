@@ -1,10 +1,16 @@
 """Configuration management for isoproxy safe pass-through proxy."""
 
 import os
+from functools import cached_property
 from typing import Dict, Any
+
+import httpx
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+_LOGGING_MODES = frozenset({"off", "metadata", "debug"})
+_LOGGING_MODES_MSG = f"logging_mode must be one of: {sorted(_LOGGING_MODES)}"
+
 
 class ProxyConfig(BaseSettings):
     """Configuration for the safe pass-through proxy server.
@@ -55,6 +61,25 @@ class ProxyConfig(BaseSettings):
         le=600,  # Max 10 minutes
     )
 
+    # Upstream Connection Pool
+    max_upstream_connections: int = Field(
+        default=100,
+        description="Maximum concurrent connections to the upstream provider",
+        ge=1,
+    )
+    max_idle_upstream_connections: int = Field(
+        default=20,
+        description="Maximum idle keep-alive connections kept in the pool",
+        ge=0,
+    )
+    keepalive_expiry_seconds: float = Field(
+        default=30.0,
+        description="Seconds before an idle pooled connection is closed "
+        "(keep below the provider's idle timeout)",
+        gt=0,
+        le=300,
+    )
+
     # Server Configuration
     host: str = Field(
         default="127.0.0.1",
@@ -87,26 +112,62 @@ class ProxyConfig(BaseSettings):
     @classmethod
     def validate_logging_mode(cls, v: str) -> str:
         """Validate logging mode is one of the allowed values."""
-        allowed = {"off", "metadata", "debug"}
-        if v not in allowed:
-            raise ValueError(f"logging_mode must be one of: {allowed}")
+        if v not in _LOGGING_MODES:
+            raise ValueError(_LOGGING_MODES_MSG)
         return v
 
+    @cached_property
+    def log_metadata(self) -> bool:
+        """Whether request/response metadata should be logged."""
+        return self.logging_mode in ("metadata", "debug")
+
     def get_active_provider_config(self) -> Dict[str, Any]:
         """Get configuration for the active provider."""
         return self.providers[self.provider]
     
     def get_upstream_endpoint(self) -> str:
         """Get the upstream endpoint URL for the active provider."""
+        return self.upstream_url
+
+    def get_api_key(self) -> str:
+        """Get API key for the active provider from environment."""
+        return self.api_key
+
+    @cached_property
+    def upstream_url(self) -> str:
+        """Upstream endpoint URL, resolved once per configuration."""
         provider_config = self.get_active_provider_config()
         endpoint = provider_config["endpoint"].rstrip("/")
         return f"{endpoint}/v1/messages"
-    
-    def get_api_key(self) -> str:
-        """Get API key for the active provider from environment."""
+
+    @cached_property
+    def api_key(self) -> str:
+        """API key for the active provider, read from the environment once."""
         provider_config = self.get_active_provider_config()
         env_var = provider_config["api_key_env"]
         api_key = os.getenv(env_var)
         if not api_key:
             raise ValueError(f"API key not found in environment variable: {env_var}")
         return api_key
+
+    @cached_property
+    def auth_header(self) -> str:
+        """Authorization header value for the active provider."""
+        return f"Bearer {self.api_key}"
+
+    @cached_property
+    def upstream_headers(self) -> httpx.Headers:
+        """Headers sent with every upstream request, built once per configuration.
+
+        Returned as httpx.Headers so httpx does not re-normalize them on each
+        request. Callers must not mutate the returned object.
+        """
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": self.auth_header,
+        }
+
+        # Add Anthropic-specific headers if needed
+        if "anthropic" in self.provider.lower():
+            headers["anthropic-version"] = "2023-06-01"
+        return httpx.Headers(headers)
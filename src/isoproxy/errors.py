@@ -8,7 +8,8 @@ information leakage.
 import logging
 
 from fastapi import Request
-from fastapi.responses import JSONResponse
+
+from isoproxy.responses import ORJSONResponse
 
 logger = logging.getLogger("isoproxy")
 
@@ -19,6 +20,16 @@ class ProxyUpstreamError(Exception):
     pass
 
 
+class RequestTooLargeError(Exception):
+    """Raised when a request body exceeds the configured size limit.
+
+    A client-side rejection, deliberately not a ProxyUpstreamError, so it is
+    never reported as an upstream failure.
+    """
+
+    pass
+
+
 def create_error_response(error_type: str, message: str) -> dict:
     """Create a standardized error response for proxy-level errors.
 
@@ -37,7 +48,7 @@ def create_error_response(error_type: str, message: str) -> dict:
 
 async def proxy_upstream_error_handler(
     request: Request, exc: ProxyUpstreamError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle proxy-level upstream failures.
 
     This handler only deals with proxy-level errors like network failures,
@@ -49,13 +60,36 @@ async def proxy_upstream_error_handler(
         exc: The ProxyUpstreamError exception
 
     Returns:
-        JSONResponse with 502 status and proxy error
+        ORJSONResponse with 502 status and proxy error
     """
     # Log the error without sensitive details
-    logger.error(f"Proxy upstream error: {exc}")
+    logger.error("Proxy upstream error: %s", exc)
 
     # Return proxy-level 502 error
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=502,
         content=create_error_response("proxy_error", str(exc)),
     )
+
+
+async def request_too_large_handler(
+    request: Request, exc: RequestTooLargeError
+) -> ORJSONResponse:
+    """Handle requests rejected for exceeding max_request_bytes.
+
+    The same 413 response is returned whether the size was taken from the
+    Content-Length header or counted after reading a chunked body.
+
+    Args:
+        request: The FastAPI request object
+        exc: The RequestTooLargeError exception
+
+    Returns:
+        ORJSONResponse with 413 status and proxy error
+    """
+    logger.warning("Rejected request: %s", exc)
+
+    return ORJSONResponse(
+        status_code=413,
+        content=create_error_response("proxy_error", str(exc)),
+    )
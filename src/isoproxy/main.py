@@ -9,12 +9,25 @@ This module implements a safe pass-through proxy following these principles:
 """
 
 import logging
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
+
+import orjson
+from fastapi import FastAPI, Request, Response
 
 from isoproxy.config import ProxyConfig
-from isoproxy.errors import ProxyUpstreamError, proxy_upstream_error_handler
-from isoproxy.proxy import safe_forward_request, validate_request_size, parse_request_safely
+from isoproxy.errors import (
+    ProxyUpstreamError,
+    RequestTooLargeError,
+    proxy_upstream_error_handler,
+    request_too_large_handler,
+)
+from isoproxy.proxy import (
+    create_upstream_client,
+    parse_request_safely,
+    safe_forward_request,
+    validate_request_size,
+)
+from isoproxy.responses import ORJSONResponse
 
 # Configure logging based on config (will be updated after config load)
 logger = logging.getLogger("isoproxy")
@@ -22,7 +35,7 @@ logger = logging.getLogger("isoproxy")
 # Load configuration at startup (fail fast on missing/invalid config)
 try:
     config = ProxyConfig()
-    
+
     # Configure logging level based on config
     if config.logging_mode == "off":
         logging.getLogger("isoproxy").setLevel(logging.CRITICAL)
@@ -30,27 +43,74 @@ try:
         logging.getLogger("isoproxy").setLevel(logging.DEBUG)
     else:  # metadata
         logging.getLogger("isoproxy").setLevel(logging.INFO)
-    
+
     # Set up logging format
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         force=True
     )
-    
+
     # Log startup info (metadata only)
     logger.info("Safe pass-through proxy starting")
-    logger.info(f"Active provider: {config.provider}")
-    logger.info(f"Listening on: {config.host}:{config.port}")
-    logger.info(f"Request limit: {config.max_request_bytes} bytes")
-    logger.info(f"Response limit: {config.max_response_bytes} bytes")
-    logger.info(f"Timeout: {config.timeout_seconds}s")
-    logger.info(f"Logging mode: {config.logging_mode}")
-    
+    logger.info("Active provider: %s", config.provider)
+    logger.info("Listening on: %s:%s", config.host, config.port)
+    logger.info("Request limit: %d bytes", config.max_request_bytes)
+    logger.info("Response limit: %d bytes", config.max_response_bytes)
+    logger.info("Timeout: %ds", config.timeout_seconds)
+    logger.info(
+        "Upstream pool: %d connections, %d idle, %ss keep-alive",
+        config.max_upstream_connections,
+        config.max_idle_upstream_connections,
+        config.keepalive_expiry_seconds,
+    )
+    logger.info("Logging mode: %s", config.logging_mode)
+
 except Exception as e:
-    logger.error(f"Configuration error: {e}")
+    logger.error("Configuration error: %s", e)
     raise
 
+# Hot-path settings are constant after startup; bind them once
+_MAX_REQUEST_BYTES = config.max_request_bytes
+_LOG_METADATA = config.log_metadata
+
+
+def _fixed_error_response(status_code: int, detail: str) -> Response:
+    """Build an immutable error response that can be returned repeatedly."""
+    return Response(
+        content=orjson.dumps({"detail": detail}),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+# Fixed error responses are built once instead of per rejected request
+_METHOD_NOT_ALLOWED = _fixed_error_response(405, "Method not allowed")
+_ENDPOINT_NOT_ALLOWED = _fixed_error_response(404, "Endpoint not allowed")
+_INTERNAL_ERROR = _fixed_error_response(500, "Internal server error")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Own the shared upstream HTTP client for the lifetime of the app.
+
+    The upstream endpoint and API key are resolved here rather than at
+    import, so the server still fails fast on startup if they are missing.
+    """
+    try:
+        config.get_upstream_endpoint()
+        config.get_api_key()
+    except Exception as e:
+        logger.error("Configuration error: %s", e)
+        raise
+
+    app.state.http_client = create_upstream_client(config)
+    try:
+        yield
+    finally:
+        await app.state.http_client.aclose()
+
+
 # Create FastAPI application
 app = FastAPI(
     title="Isoproxy Safe Pass-Through",
@@ -58,18 +118,22 @@ app = FastAPI(
     version="2.0.0",
     docs_url=None,  # Disable Swagger UI (reduce attack surface)
     redoc_url=None,  # Disable ReDoc
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Register exception handlers
 app.add_exception_handler(ProxyUpstreamError, proxy_upstream_error_handler)
+app.add_exception_handler(RequestTooLargeError, request_too_large_handler)
 
 
 @app.post("/v1/messages")
-async def messages_endpoint(request: Request) -> JSONResponse:
+async def messages_endpoint(request: Request) -> Response:
     """Handle POST /v1/messages - safe pass-through to upstream provider.
 
     This endpoint implements safe pass-through by:
-    1. Validating request size limits (no semantic validation)
+    1. Validating request size limits (no semantic validation), rejecting
+       declared oversized requests from Content-Length before reading the body
     2. Forwarding request verbatim to allowlisted provider endpoint
     3. Returning upstream response unchanged (preserves protocol fidelity)
     4. Never exposing credentials to the agent
@@ -78,86 +142,78 @@ async def messages_endpoint(request: Request) -> JSONResponse:
         request: Raw FastAPI Request object
 
     Returns:
-        JSONResponse with upstream status code and body (unchanged)
+        Response with upstream status code, content type and body bytes (unchanged)
 
     Raises:
-        HTTPException: On request size limits or parsing errors
-        ProxyUpstreamError: On upstream failures (handled by exception handler)
+        RequestTooLargeError: If the request exceeds max_request_bytes
+            (handled by exception handler)
+        ProxyUpstreamError: On request parsing errors and upstream failures
+            (handled by exception handler)
     """
     try:
+        # Reject declared oversized bodies before buffering them
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit():
+            validate_request_size(int(content_length), _MAX_REQUEST_BYTES)
+
         # Get raw request body
         raw_body = await request.body()
-        
-        # Enforce request size limits (MUST enforce)
-        validate_request_size(raw_body, config)
-        
-        # Parse JSON safely (no semantic validation)
-        request_data = parse_request_safely(raw_body)
-        
+
+        # Enforce request size limits (MUST enforce, also covers chunked bodies)
+        validate_request_size(len(raw_body), _MAX_REQUEST_BYTES)
+
+        # Reject invalid JSON (no semantic validation); the original bytes
+        # are forwarded, so the parsed data itself is not needed
+        parse_request_safely(raw_body)
+
         # Log metadata only
-        if config.logging_mode in ["metadata", "debug"]:
-            logger.info(f"Request received, size: {len(raw_body)} bytes")
-        
+        if _LOG_METADATA:
+            logger.info("Request received, size: %d bytes", len(raw_body))
+
         # Forward to upstream with safe pass-through
-        status_code, response_body = await safe_forward_request(request_data, config)
+        status_code, response_body, content_type = await safe_forward_request(
+            raw_body, config, request.app.state.http_client
+        )
 
-        # Return verbatim (preserve all provider-specific fields)
-        return JSONResponse(
-            status_code=status_code,
+        # Return upstream bytes verbatim (no decode/re-encode round-trip)
+        return Response(
             content=response_body,
+            status_code=status_code,
+            media_type=content_type,
         )
 
-    except ProxyUpstreamError:
-        # Let the exception handler deal with it
+    except (RequestTooLargeError, ProxyUpstreamError):
+        # Let the exception handlers deal with it
         raise
 
     except Exception as e:
         # Catch any unexpected programming errors
-        logger.error(f"Unexpected error in /v1/messages: {type(e).__name__}: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail="Internal server error",
-        )
+        logger.error("Unexpected error in /v1/messages: %s: %s", type(e).__name__, e)
+        return _INTERNAL_ERROR
 
 
 @app.api_route("/v1/messages", methods=["GET", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"])
-async def messages_method_not_allowed() -> JSONResponse:
+async def messages_method_not_allowed() -> Response:
     """Reject non-POST requests to /v1/messages with 405."""
-    raise HTTPException(status_code=405, detail="Method not allowed")
+    return _METHOD_NOT_ALLOWED
 
 
 @app.api_route("/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"])
-async def catch_all_reject(path: str) -> JSONResponse:
+async def catch_all_reject(path: str) -> Response:
     """Reject all other routes with 404.
-    
+
     Safe pass-through mode only supports /v1/messages endpoint.
     All other paths are rejected to maintain minimal attack surface.
-    
+
     This differs from the old "passthrough mode" which would forward
     arbitrary paths - that violated the safe pass-through design principle
     of strict endpoint allowlisting.
-    
+
     Args:
         path: The requested path
 
     Returns:
         404 error response
     """
-    logger.warning(f"Blocked request to disallowed path: /{path}")
-    raise HTTPException(status_code=404, detail="Endpoint not allowed")
-
-
-@app.get("/health")
-async def health_check() -> JSONResponse:
-    """Basic health check endpoint.
-    
-    Returns basic status without exposing sensitive configuration details.
-    """
-    return JSONResponse(
-        status_code=200,
-        content={
-            "status": "ok",
-            "proxy": "safe-pass-through", 
-            "provider": config.provider
-        }
-    )
\ No newline at end of file
+    logger.warning("Blocked request to disallowed path: /%s", path)
+    return _ENDPOINT_NOT_ALLOWED
@@ -8,123 +8,142 @@ This module implements transparent forwarding with strict boundaries:
 """
 
 import logging
-import json
 from typing import Any, Dict, Tuple
 
 import httpx
+import orjson
 
 from isoproxy.config import ProxyConfig
-from isoproxy.errors import ProxyUpstreamError
+from isoproxy.errors import ProxyUpstreamError, RequestTooLargeError
 
 logger = logging.getLogger("isoproxy")
 
 
+def create_upstream_client(config: ProxyConfig) -> httpx.AsyncClient:
+    """Create the HTTP client shared by all upstream requests.
+
+    A single client keeps a pool of keep-alive connections to the provider,
+    so TCP and TLS setup are paid once rather than on every request. HTTP/2
+    is negotiated when the provider supports it, letting concurrent requests
+    share one connection.
+
+    Args:
+        config: Proxy configuration with timeout and connection pool settings
+
+    Returns:
+        Configured httpx.AsyncClient (caller is responsible for closing it)
+    """
+    return httpx.AsyncClient(
+        timeout=config.timeout_seconds,
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=config.max_upstream_connections,
+            max_keepalive_connections=config.max_idle_upstream_connections,
+            keepalive_expiry=config.keepalive_expiry_seconds,
+        ),
+    )
+
+
 async def safe_forward_request(
-    request_data: Dict[str, Any], 
-    config: ProxyConfig
-) -> Tuple[int, Dict[str, Any]]:
+    request_body: bytes,
+    config: ProxyConfig,
+    client: httpx.AsyncClient,
+) -> Tuple[int, memoryview, str]:
     """Safely forward request to upstream provider with strict boundaries.
 
     This function implements safe pass-through by:
     1. Enforcing endpoint allowlisting (no arbitrary URLs)
     2. Injecting credentials securely (agent never sees them)
-    3. Preserving protocol fidelity (forward unknown fields)
+    3. Preserving protocol fidelity (forward the original request bytes)
     4. Enforcing resource limits (size, timeout)
     5. Returning responses verbatim (no semantic modification)
 
     Args:
-        request_data: Raw request data as dictionary
+        request_body: Raw request body bytes (already checked to be valid JSON)
         config: Proxy configuration with provider settings
+        client: Shared upstream HTTP client (see create_upstream_client)
 
     Returns:
-        Tuple of (status_code, response_body) from upstream
+        Tuple of (status_code, response_body, content_type) from upstream,
+        with the body as a read-only view over the raw upstream bytes
 
     Raises:
-        ProxyUpstreamError: On any failure (enforces fail-closed)
+        ProxyUpstreamError: On any upstream failure (enforces fail-closed)
     """
+    # Get provider configuration (enforced allowlist) and limits once
+    upstream_url = config.upstream_url
+    max_response_bytes = config.max_response_bytes
+    timeout_seconds = config.timeout_seconds
+    log_metadata = config.log_metadata
+
+    # Prebuilt headers with credential injection (constant per config)
+    headers = config.upstream_headers
+
     try:
-        # Get provider configuration (enforced allowlist)
-        upstream_url = config.get_upstream_endpoint()
-        api_key = config.get_api_key()
-        
-        # Construct headers with credential injection
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}",
-        }
-        
-        # Add Anthropic-specific headers if needed
-        provider_config = config.get_active_provider_config()
-        if "anthropic" in config.provider.lower():
-            headers["anthropic-version"] = "2023-06-01"
-        
         # Log metadata only (never request/response content)
-        if config.logging_mode in ["metadata", "debug"]:
-            logger.info(f"Forwarding to: {config.provider} endpoint")
-            if config.logging_mode == "debug":
-                logger.debug(f"Headers: {list(headers.keys())}")
-
-        # Forward request with resource limits enforced
-        async with httpx.AsyncClient(
-            timeout=config.timeout_seconds,
-            limits=httpx.Limits(
-                max_keepalive_connections=5,
-                max_connections=10
-            )
-        ) as client:
-            response = await client.post(
-                upstream_url,
-                json=request_data,  # Pass through verbatim
-                headers=headers,
-            )
-
-            # Check response size limit
-            response_size = len(response.content)
-            if response_size > config.max_response_bytes:
-                raise ProxyUpstreamError(
-                    f"Response too large: {response_size} bytes (limit: {config.max_response_bytes})"
-                )
-
-            # Log response metadata
-            if config.logging_mode in ["metadata", "debug"]:
-                logger.info(f"Response: {response.status_code}, size: {response_size} bytes")
-
-            # Return response verbatim - no error normalization in safe pass-through
-            # The upstream provider's error format should be preserved for compatibility
-            try:
-                response_data = response.json()
-            except json.JSONDecodeError:
-                # If not JSON, return as text in error format
-                response_data = {"error": {"type": "proxy_error", "message": "Non-JSON response from provider"}}
-                
-            return response.status_code, response_data
+        if log_metadata:
+            logger.info("Forwarding to: %s endpoint", config.provider)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Headers: %s", list(headers.keys()))
+
+        # Forward request over the shared pooled client, streaming the response
+        async with client.stream(
+            "POST",
+            upstream_url,
+            content=request_body,  # Pass through verbatim, no re-serialization
+            headers=headers,
+        ) as response:
+            # Check response size limit while reading, aborting as soon as it
+            # is exceeded instead of buffering the whole body first
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body += chunk
+                if len(body) > max_response_bytes:
+                    raise ProxyUpstreamError(
+                        f"Response too large: over {max_response_bytes} bytes"
+                    )
+            response_size = len(body)
+
+        # Log response metadata
+        if log_metadata:
+            logger.info("Response: %d, size: %d bytes", response.status_code, response_size)
+
+        # Return response bytes verbatim - no error normalization in safe pass-through
+        # The upstream provider's error format should be preserved for compatibility
+        content_type = response.headers.get("content-type", "application/json")
+        # A memoryview hands the buffer to the response without copying it
+        return response.status_code, memoryview(body).toreadonly(), content_type
 
     except httpx.TimeoutException as e:
-        logger.error(f"Request timeout after {config.timeout_seconds}s")
-        raise ProxyUpstreamError(f"Request timed out after {config.timeout_seconds}s")
+        logger.error("Request timeout after %ss", timeout_seconds)
+        raise ProxyUpstreamError(f"Request timed out after {timeout_seconds}s") from e
 
     except httpx.RequestError as e:
-        logger.error(f"Network error: {type(e).__name__}")
-        raise ProxyUpstreamError(f"Network error: {type(e).__name__}")
+        logger.error("Network error: %s", type(e).__name__)
+        raise ProxyUpstreamError(f"Network error: {type(e).__name__}") from e
 
-    except Exception as e:
-        logger.error(f"Unexpected error during request: {type(e).__name__}: {e}")
-        raise ProxyUpstreamError(f"Unexpected error: {type(e).__name__}")
+    except httpx.HTTPError as e:
+        # Any other httpx failure; ProxyUpstreamError and cancellation propagate
+        logger.error("Unexpected error during request: %s", type(e).__name__)
+        raise ProxyUpstreamError(f"Unexpected error: {type(e).__name__}") from e
 
 
-def validate_request_size(request_body: bytes, config: ProxyConfig) -> None:
+def validate_request_size(request_size: int, max_request_bytes: int) -> None:
     """Validate request size against configured limits.
     
+    Used both for the declared Content-Length (before the body is read) and
+    for the actual body length, so either path rejects with the same error.
+
     Args:
-        request_body: Raw request body bytes
-        config: Proxy configuration
+        request_size: Request body size in bytes
+        max_request_bytes: Configured request size limit in bytes
         
     Raises:
-        ProxyUpstreamError: If request exceeds size limits
+        RequestTooLargeError: If request exceeds size limits
     """
-    if len(request_body) > config.max_request_bytes:
-        raise ProxyUpstreamError(
-            f"Request too large: {len(request_body)} bytes (limit: {config.max_request_bytes})"
+    if request_size > max_request_bytes:
+        raise RequestTooLargeError(
+            f"Request too large: {request_size} bytes (limit: {max_request_bytes})"
         )
 
 
@@ -141,8 +160,8 @@ def parse_request_safely(request_body: bytes) -> Dict[str, Any]:
         ProxyUpstreamError: On JSON parsing errors
     """
     try:
-        return json.loads(request_body.decode('utf-8'))
-    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        return orjson.loads(request_body)
+    except orjson.JSONDecodeError as e:
         raise ProxyUpstreamError(f"Invalid JSON: {e}")
     except Exception as e:
         raise ProxyUpstreamError(f"Request parsing error: {e}")
\ No newline at end of file
@@ -0,0 +1,19 @@
+"""Response classes for safe pass-through proxy.
+
+JSON encoding is delegated to orjson so that the proxy spends as little
+time as possible serializing payloads on the event loop.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that serializes its content with orjson."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
@@ -1,8 +1,11 @@
 """Pytest fixtures for isoproxy tests."""
 
+import httpx
+import orjson
 import pytest
+from starlette.responses import Response
+
 from isoproxy.config import ProxyConfig
-from isoproxy.models import Message, MessagesRequest
 
 
 @pytest.fixture
@@ -23,16 +26,6 @@ def mock_config_with_default_model(monkeypatch):
     return ProxyConfig()
 
 
-@pytest.fixture
-def valid_request():
-    """Provide a valid MessagesRequest."""
-    return MessagesRequest(
-        model="claude-3-5-sonnet-20241022",
-        messages=[Message(role="user", content="Hello")],
-        max_tokens=1024,
-    )
-
-
 @pytest.fixture
 def valid_request_dict():
     """Provide a valid request as a dictionary."""
@@ -55,3 +48,43 @@ def mock_upstream_success_response():
         "stop_reason": "end_turn",
         "usage": {"input_tokens": 10, "output_tokens": 20},
     }
+
+
+def fast_upstream_asgi(status_code, body, content_type="application/json"):
+    """Build a minimal ASGI upstream that always replies with the given payload."""
+    response = Response(content=body, status_code=status_code, media_type=content_type)
+
+    async def app(scope, receive, send):
+        await response(scope, receive, send)
+
+    return app
+
+
+@pytest.fixture
+def pass_through_config(monkeypatch):
+    """Provide safe pass-through configuration for the default provider."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key-123")
+    return ProxyConfig(_env_file=None)
+
+
+@pytest.fixture
+async def fast_upstream():
+    """Provide a factory for upstream clients served in-process by constant ASGI apps."""
+    clients = []
+
+    def factory(status_code, body, content_type="application/json"):
+        app = fast_upstream_asgi(status_code, body, content_type)
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+        clients.append(client)
+        return client
+
+    yield factory
+
+    for client in clients:
+        await client.aclose()
+
+
+@pytest.fixture
+def fast_client(fast_upstream, mock_upstream_success_response):
+    """Provide an upstream client that always returns the mock success response."""
+    return fast_upstream(200, orjson.dumps(mock_upstream_success_response))
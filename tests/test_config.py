@@ -112,3 +112,23 @@ def test_invalid_port_raises_error(monkeypatch):
 
     with pytest.raises(ValidationError):
         ProxyConfig()
+
+
+def test_upstream_pool_defaults(monkeypatch):
+    """Test that upstream connection pool settings have sensible defaults."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test123")
+
+    config = ProxyConfig(_env_file=None)
+
+    assert config.max_upstream_connections == 100
+    assert config.max_idle_upstream_connections == 20
+    assert config.keepalive_expiry_seconds == 30.0
+
+
+def test_invalid_keepalive_expiry_raises_error(monkeypatch):
+    """Test that a non-positive keep-alive expiry is rejected."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test123")
+    monkeypatch.setenv("PROXY_KEEPALIVE_EXPIRY_SECONDS", "0")
+
+    with pytest.raises(ValidationError):
+        ProxyConfig(_env_file=None)
@@ -0,0 +1,77 @@
+"""Tests for safe pass-through forwarding."""
+
+import httpx
+import orjson
+import pytest
+from pytest_httpx import HTTPXMock
+
+from isoproxy.errors import ProxyUpstreamError
+from isoproxy.proxy import create_upstream_client, safe_forward_request
+
+
+@pytest.mark.asyncio
+async def test_successful_response_returned_verbatim(
+    pass_through_config, fast_client, mock_upstream_success_response
+):
+    """Test that upstream response bytes and content type are returned unchanged."""
+    status_code, body, content_type = await safe_forward_request(
+        b'{"model": "m"}', pass_through_config, fast_client
+    )
+
+    assert status_code == 200
+    assert bytes(body) == orjson.dumps(mock_upstream_success_response)
+    assert content_type == "application/json"
+
+
+@pytest.mark.asyncio
+async def test_upstream_error_passed_through(pass_through_config, fast_upstream):
+    """Test that upstream error status and body are not normalized."""
+    upstream_error = b'{"type":"error","error":{"type":"rate_limit_error","message":"x"}}'
+    client = fast_upstream(429, upstream_error)
+
+    status_code, body, _ = await safe_forward_request(b"{}", pass_through_config, client)
+
+    assert status_code == 429
+    assert bytes(body) == upstream_error
+
+
+@pytest.mark.asyncio
+async def test_oversized_response_raises_proxy_error(pass_through_config, fast_upstream):
+    """Test that responses over max_response_bytes are rejected."""
+    limit = pass_through_config.max_response_bytes
+    client = fast_upstream(200, b"x" * (limit + 1))
+
+    with pytest.raises(ProxyUpstreamError, match="Response too large"):
+        await safe_forward_request(b"{}", pass_through_config, client)
+
+
+@pytest.mark.asyncio
+async def test_request_bytes_and_headers_sent_upstream(
+    pass_through_config, httpx_mock: HTTPXMock
+):
+    """Test that the original request bytes and injected headers reach upstream."""
+    httpx_mock.add_response(
+        url="https://api.anthropic.com/v1/messages",
+        method="POST",
+        json={"id": "msg_123"},
+    )
+    raw_body = b'{"model":  "m", "unknown_field": 1.10}'
+
+    async with create_upstream_client(pass_through_config) as client:
+        await safe_forward_request(raw_body, pass_through_config, client)
+
+    request = httpx_mock.get_request()
+    assert request.content == raw_body
+    assert request.headers["Authorization"] == "Bearer test-key-123"
+    assert request.headers["Content-Type"] == "application/json"
+    assert request.headers["anthropic-version"] == "2023-06-01"
+
+
+@pytest.mark.asyncio
+async def test_network_error_raises_proxy_error(pass_through_config, httpx_mock: HTTPXMock):
+    """Test that network errors raise ProxyUpstreamError."""
+    httpx_mock.add_exception(httpx.ConnectError("Connection failed"))
+
+    async with create_upstream_client(pass_through_config) as client:
+        with pytest.raises(ProxyUpstreamError, match="Network error"):
+            await safe_forward_request(b"{}", pass_through_config, client)
@@ -1,9 +1,12 @@
 """Integration tests for the FastAPI application."""
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 from pytest_httpx import HTTPXMock
 
+from tests.conftest import fast_upstream_asgi
+
 
 @pytest.fixture
 def client(monkeypatch):
@@ -142,3 +145,107 @@ def test_invalid_json_returns_422(client):
     )
 
     assert response.status_code == 422
+
+
+@pytest.fixture
+def small_limit_client(monkeypatch):
+    """Create a test client with a small request size limit."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key-123")
+
+    import isoproxy.main
+
+    monkeypatch.setattr(isoproxy.main, "_MAX_REQUEST_BYTES", 16)
+
+    with TestClient(isoproxy.main.app) as test_client:
+        yield test_client
+
+
+def test_content_length_over_limit_returns_413(small_limit_client):
+    """Test that a declared oversized body is rejected before it is read."""
+    response = small_limit_client.post("/v1/messages", content=b"x" * 32)
+
+    assert response.status_code == 413
+    body = response.json()
+    assert body["type"] == "error"
+    assert body["error"]["type"] == "proxy_error"
+    assert body["error"]["message"] == "Request too large: 32 bytes (limit: 16)"
+
+
+def test_chunked_body_over_limit_returns_413(small_limit_client):
+    """Test that an oversized chunked body gets the same 413 proxy error."""
+
+    def chunks():
+        yield b"x" * 20
+        yield b"x" * 12
+
+    response = small_limit_client.post("/v1/messages", content=chunks())
+
+    assert response.status_code == 413
+    body = response.json()
+    assert body["type"] == "error"
+    assert body["error"]["type"] == "proxy_error"
+    assert body["error"]["message"] == "Request too large: 32 bytes (limit: 16)"
+
+
+def test_fixed_error_responses(small_limit_client):
+    """Test the prebuilt 404 and 405 response bodies."""
+    response = small_limit_client.get("/v1/messages")
+    assert response.status_code == 405
+    assert response.json() == {"detail": "Method not allowed"}
+
+    response = small_limit_client.post("/v1/completions", content=b"{}")
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Endpoint not allowed"}
+
+
+def test_health_endpoint_not_exposed(small_limit_client):
+    """Test that /health is rejected like any other path (specs.md section 8)."""
+    response = small_limit_client.get("/health")
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Endpoint not allowed"}
+
+
+def test_unexpected_error_returns_500(small_limit_client, monkeypatch):
+    """Test that unexpected failures return the prebuilt 500 response."""
+    import isoproxy.main
+
+    async def failing_forward(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(isoproxy.main, "safe_forward_request", failing_forward)
+
+    response = small_limit_client.post("/v1/messages", content=b"{}")
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Internal server error"}
+
+
+@pytest.fixture
+def proxied_client(monkeypatch):
+    """Create a factory for app test clients backed by an in-process upstream."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key-123")
+
+    import isoproxy.main
+
+    def factory(status_code, body, content_type="application/json"):
+        def create_client(config):
+            app = fast_upstream_asgi(status_code, body, content_type)
+            return httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+
+        monkeypatch.setattr(isoproxy.main, "create_upstream_client", create_client)
+        return TestClient(isoproxy.main.app)
+
+    return factory
+
+
+def test_upstream_response_passes_through_app_unchanged(proxied_client, valid_request_dict):
+    """Test that status, body bytes and content type reach the client verbatim."""
+    upstream_body = b'{"id": "msg_123",  "type": "message", "content": []}'
+
+    with proxied_client(201, upstream_body, "application/vnd.test+json") as client:
+        response = client.post("/v1/messages", json=valid_request_dict)
+
+    assert response.status_code == 201
+    assert response.content == upstream_body
+    assert response.headers["content-type"] == "application/vnd.test+json"